@@ -205,5 +205,19 @@ def extract(
     typer.echo(f"📁 Output files saved under: {destination.resolve()}")
 
 
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the CLI in-process with the given arguments and return its exit code.
+    Unlike calling `app()` directly, this never leaves via SystemExit, so callers (and tests)
+    can reuse the current interpreter instead of spawning a new one.
+    """
+    try:
+        app(args=argv)
+    except SystemExit as exc:
+        code = exc.code
+        return code if isinstance(code, int) else int(code is not None)
+    return 0
+
+
 if __name__ == "__main__":
     app()
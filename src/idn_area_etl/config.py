@@ -1,5 +1,6 @@
 from collections.abc import Iterable
 from dataclasses import dataclass
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any, Literal, Protocol, cast, runtime_checkable
 
@@ -10,7 +11,7 @@ DEFAULT_CONFIG_FILENAME = "idnareaetl.toml"
 # --- Models ------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataConfig:
     batch_size: int
     output_headers: tuple[str, ...]
@@ -72,6 +73,21 @@ class TomlLoader:
             return tomllib.load(f)
 
 
+class RtomlLoader:
+    """Loader for TOML files backed by the Rust `rtoml` parser (optional dependency)."""
+
+    def load(self, path: Path) -> dict[str, Any]:
+        import rtoml  # pyright: ignore[reportMissingImports]
+
+        # rtoml is typed when installed (dev group) but unknown without it; the cast covers both
+        return cast(dict[str, Any], rtoml.load(path))  # pyright: ignore[reportUnnecessaryCast]
+
+
+def default_loader() -> FileLoader:
+    """Prefer rtoml when it is installed; fall back to the stdlib `tomllib` loader."""
+    return RtomlLoader() if find_spec("rtoml") is not None else TomlLoader()
+
+
 class AppConfig:
     """Application configuration manager."""
 
@@ -80,7 +96,7 @@ class AppConfig:
         cls,
         source_path: Path = Path.cwd() / DEFAULT_CONFIG_FILENAME,
         *,
-        loader: FileLoader = TomlLoader(),
+        loader: FileLoader = default_loader(),
     ) -> Config:
         """Load configuration. If source_path is None, load from the default location."""
         if not source_path.is_file():
@@ -1,4 +1,4 @@
-import re
+import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
 from types import TracebackType
@@ -13,6 +13,7 @@ from idn_area_etl.utils import (
     DISTRICT_CODE_LENGTH,
     VILLAGE_CODE_LENGTH,
     RE_ISLAND_CODE,
+    RE_POPULATED_STATUS,
     clean_name,
     fix_wrapped_name,
     format_coordinate,
@@ -107,29 +108,37 @@ class AreaExtractor(TableExtractor):
 
     areas = frozenset({"province", "regency", "district", "village"})
 
+    # code length -> (area, parent code length); looked up once per row
+    _CHILD_LEVELS: dict[int, tuple[Area, int]] = {
+        REGENCY_CODE_LENGTH: ("regency", PROVINCE_CODE_LENGTH),
+        DISTRICT_CODE_LENGTH: ("district", REGENCY_CODE_LENGTH),
+        VILLAGE_CODE_LENGTH: ("village", DISTRICT_CODE_LENGTH),
+    }
+
     def __init__(self, destination: Path, output_name: str, config: Config) -> None:
         super().__init__(destination, output_name, config=config)
         self._seen_provinces: set[str] = set()
 
     def matches(self, df: pd.DataFrame) -> bool:
-        if df.empty or df.shape[0] < 1:
+        if df.empty or df.shape[1] < 2:
             return False
-        normalized_headers = [normalize_words(str(col)).lower() for col in df.iloc[0]]
-        return (
-            len(normalized_headers) >= 2
-            and normalized_headers[0] == "kode"
-            and "nama provinsi" in normalized_headers[1]
+        # Only the first two header cells decide; read them directly instead of the whole row
+        return normalize_words(str(df.iat[0, 0])).lower() == "kode" and (
+            "nama provinsi" in normalize_words(str(df.iat[0, 1])).lower()
         )
 
-    def _code_name_pairs(self, df: pd.DataFrame) -> list[tuple[str, str]]:
+    def _code_name_columns(self, df: pd.DataFrame) -> tuple[list[str], list[str]]:
+        """Return parallel (codes, names) lists for the data rows holding both."""
         if df.empty or df.shape[1] < 2:
-            return []
+            return [], []
 
         # Skip header rows; keep only data rows
         data_df = df.iloc[2:, :]
 
-        # Codes as string, strip spaces
+        # Codes as string, strip spaces; drop code-less rows before the per-cell name cleaning
         codes = data_df.iloc[:, 0].astype(str).str.strip()
+        has_code = codes.ne("")
+        data_df, codes = data_df[has_code], codes[has_code]
 
         # Decide name columns based on table variant:
         # 6-column tables -> use columns [1, 3]
@@ -139,20 +148,16 @@ class AreaExtractor(TableExtractor):
         else:
             name_cols = [1, 4, 5, 6]
 
-        # Pick the first non-empty candidate per row, then clean/normalize
-        names = (
-            data_df.iloc[:, name_cols]
-            .astype(str)
-            .map(str.strip)  # element-wise strip
-            .replace("", pd.NA)
-            .bfill(axis=1)
-            .iloc[:, 0]
-            .fillna("")
-            .map(lambda s: normalize_words(clean_name(fix_wrapped_name(s))) if s else "")
-        )
-        # Keep only rows that have both code and name
-        mask = codes.ne("") & names.ne("")
-        return list(zip(codes[mask].tolist(), names[mask].tolist()))
+        # Pick the first non-empty candidate per row, one column-wise fill per fallback column,
+        # then clean/normalize
+        candidates = data_df.iloc[:, name_cols].astype(str).map(str.strip)
+        names = candidates.iloc[:, 0]
+        for col in range(1, candidates.shape[1]):
+            names = names.where(names.ne(""), candidates.iloc[:, col])
+        names = names.map(lambda s: normalize_words(clean_name(fix_wrapped_name(s))) if s else "")
+        # Keep only rows that also have a name
+        mask = names.ne("")
+        return codes[mask].tolist(), names[mask].tolist()
 
     def _extract_rows(self, df: pd.DataFrame) -> dict[Area, list[list[str]]]:
         rows_by_key: dict[Area, list[list[str]]] = {
@@ -161,18 +166,21 @@ class AreaExtractor(TableExtractor):
             "district": [],
             "village": [],
         }
-        for code, name in self._code_name_pairs(df):
+        child_levels = self._CHILD_LEVELS
+        codes, names = self._code_name_columns(df)
+        for code, name in zip(codes, names):
             L = len(code)
             if L == PROVINCE_CODE_LENGTH:
                 if code not in self._seen_provinces:
                     self._seen_provinces.add(code)
                     rows_by_key["province"].append([code, name])
-            elif L == REGENCY_CODE_LENGTH:
-                rows_by_key["regency"].append([code, code[:PROVINCE_CODE_LENGTH], name])
-            elif L == DISTRICT_CODE_LENGTH:
-                rows_by_key["district"].append([code, code[:REGENCY_CODE_LENGTH], name])
-            elif L == VILLAGE_CODE_LENGTH:
-                rows_by_key["village"].append([code, code[:DISTRICT_CODE_LENGTH], name])
+                continue
+            level = child_levels.get(L)
+            if level is None:
+                continue
+            area, parent_length = level
+            # Parent codes repeat for every child row; intern so they share one string
+            rows_by_key[area].append([code, sys.intern(code[:parent_length]), name])
         return rows_by_key
 
 
@@ -260,7 +268,14 @@ class IslandExtractor(TableExtractor):
         headers = self._norm_header_row(df.iloc[header_idx])
         colmap = self._infer_columns(headers)
 
+        idx_code = colmap["code"]
+        if idx_code is None or idx_code >= df.shape[1]:
+            return {"island": []}
+
+        # Keep only rows holding an island code, validated column-wise in one pass
         data_df = df.iloc[header_idx + 1 :]
+        codes = data_df.iloc[:, idx_code].astype(str).str.strip()
+        data_df = data_df[codes.str.match(RE_ISLAND_CODE.pattern)]
 
         rows: list[list[str]] = []
 
@@ -271,14 +286,12 @@ class IslandExtractor(TableExtractor):
                     return ""
                 return str(r[i]).strip()
 
-            code = val(colmap["code"])
-            if not code or not RE_ISLAND_CODE.match(code):
-                continue
+            code = val(idx_code)
 
             # name with "next-to-code" rescue if the name cell equals the code
             name = clean_name(fix_wrapped_name(val(colmap["name"])))
             if name == code:
-                nxt = val((colmap["code"] or 0) + 1)  # safe, code idx checked above
+                nxt = val(idx_code + 1)
                 nxt = clean_name(fix_wrapped_name(nxt))
                 if nxt and nxt != code:
                     name = nxt
@@ -287,7 +300,7 @@ class IslandExtractor(TableExtractor):
             status = val(colmap["status"]).upper()
             info = val(colmap["info"]).upper()
 
-            is_populated = 1 if re.match(r"^\s*BP\b", status) else 0
+            is_populated = 1 if RE_POPULATED_STATUS.match(status) else 0
             is_outermost_small = 1 if "PPKT" in info else 0
             regency_code = self._parent_from_code(code) or ""
 
@@ -1,14 +1,15 @@
 import re
-from typing import Iterator
+from itertools import batched
+from typing import Iterable, Iterator
 
 # =========================
 # Regex & constants (shared)
 # =========================
-RE_BEGIN_DIGITS_NEWLINE = re.compile(r"^\d+\n")
-RE_END_DIGITS_NEWLINE = re.compile(r"\n\d+$")
-RE_MULTINEWLINE = re.compile(r"\n+")
-RE_BEGIN_DIGITS_SPACE = re.compile(r"^\d+\s+")
-RE_DOUBLE_SPACE = re.compile(r"\s{2,}")
+# Leading "12\n" or trailing "\n12" (row numbers that camelot glues onto names)
+RE_EDGE_DIGITS_NEWLINE = re.compile(r"^[0-9]+\n|\n[0-9]+$")
+RE_BEGIN_DIGITS_SPACE = re.compile(r"^[0-9]+\s+")
+# A line break, or any run of 2+ whitespace characters, collapses into one space
+RE_BREAK_OR_SPACES = re.compile(r"\s{2,}|\n")
 
 # Area code lengths
 PROVINCE_CODE_LENGTH = 2
@@ -17,18 +18,27 @@ DISTRICT_CODE_LENGTH = 8
 VILLAGE_CODE_LENGTH = 13
 
 # Island code pattern sample: "11.01.40001"
-RE_ISLAND_CODE = re.compile(r"^\d{2}\.\d{2}\.\d{5}$")
+RE_ISLAND_CODE = re.compile(r"^[0-9]{2}\.[0-9]{2}\.[0-9]{5}$")
+# Island status cell marking a populated island: "BP" (not "TBP")
+RE_POPULATED_STATUS = re.compile(r"^\s*BP\b")
+
+# Page range sample: "1,3,5-7"; RE_PAGE_PART yields one (start, end?) pair per item
+RE_PAGE_RANGE = re.compile(r"^([0-9]+(-[0-9]+)?)(,([0-9]+(-[0-9]+)?))*$")
+RE_PAGE_PART = re.compile(r"([0-9]+)(?:-([0-9]+))?")
+
+# Ordered (pattern, replacement) steps applied by clean_name().
+# "^[0-9]+\s+" already treats "\n" as whitespace, so it runs before line breaks are collapsed;
+# that lets the newline and double-space passes share one regex. Keep the steps separate:
+# later ones must see earlier output (e.g. "1\n2 Name" -> "Name").
+_NAME_TRANSFORMATIONS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (RE_EDGE_DIGITS_NEWLINE, ""),
+    (RE_BEGIN_DIGITS_SPACE, ""),
+    (RE_BREAK_OR_SPACES, " "),
+)
 
 
 def _apply_regex_transformations(text: str) -> str:
-    transformations = [
-        (RE_BEGIN_DIGITS_NEWLINE, ""),
-        (RE_END_DIGITS_NEWLINE, ""),
-        (RE_MULTINEWLINE, " "),
-        (RE_BEGIN_DIGITS_SPACE, ""),
-        (RE_DOUBLE_SPACE, " "),
-    ]
-    for pattern, replacement in transformations:
+    for pattern, replacement in _NAME_TRANSFORMATIONS:
         text = pattern.sub(replacement, text)
     return text.strip()
 
@@ -38,30 +48,45 @@ def clean_name(name: str) -> str:
     return _apply_regex_transformations(text)
 
 
+def _is_wrapped_fragment(prev: str, line: str, max_line_length: int) -> bool:
+    """A short lowercase line after a full-width line is the tail of a wrapped word."""
+    return (
+        len(prev) >= max_line_length
+        and len(line) <= 3
+        and prev[-1] not in " -"
+        and line[0].islower()
+    )
+
+
 def fix_wrapped_name(name: str, max_line_length: int = 16) -> str:
     if not name:
         return ""
     if "\n" not in name:
         return name.rstrip()
-    lines = name.split("\n")
+    head, _, tail = name.partition("\n")
+    if "\n" not in tail:
+        # Single line break (the common case): no list needed
+        head, tail = head.rstrip(), tail.rstrip()
+        if not head or not tail:
+            return head or tail
+        if _is_wrapped_fragment(head, tail, max_line_length):
+            return head + tail
+        return f"{head}\n{tail}"
     fixed_lines: list[str] = []
-    for line in lines:
+    # Line still open to short lowercase continuations; emitted once the next line won't merge
+    prev = ""
+    for line in name.split("\n"):
         stripped_line = line.rstrip()
         if not stripped_line:
             continue
-        if fixed_lines:
-            prev_line = fixed_lines[-1]
-            first_char = stripped_line[0]
-            is_lowercase_fragment = first_char.islower()
-            if (
-                len(prev_line) >= max_line_length
-                and len(stripped_line) <= 3
-                and prev_line[-1] not in " -"
-                and is_lowercase_fragment
-            ):
-                fixed_lines[-1] += stripped_line
-                continue
-        fixed_lines.append(stripped_line)
+        if prev and _is_wrapped_fragment(prev, stripped_line, max_line_length):
+            prev += stripped_line
+            continue
+        if prev:
+            fixed_lines.append(prev)
+        prev = stripped_line
+    if prev:
+        fixed_lines.append(prev)
     return "\n".join(fixed_lines)
 
 
@@ -79,25 +104,37 @@ def normalize_words(words: str) -> str:
     return "".join(tokens)
 
 
-def chunked(iterable: list[int], size: int) -> Iterator[list[int]]:
-    for i in range(0, len(iterable), size):
-        yield iterable[i : i + size]
+def chunked(iterable: Iterable[int], size: int) -> Iterator[list[int]]:
+    # Same edge cases as the former range(0, len, size) slicing: 0 raises, negative yields nothing
+    if size == 0:
+        raise ValueError("chunk size must not be zero")
+    if size < 0:
+        return
+    if isinstance(iterable, list):
+        # Page lists are the usual input: slice directly instead of pulling item by item
+        for start in range(0, len(iterable), size):
+            yield iterable[start : start + size]
+        return
+    for batch in batched(iterable, size):
+        yield list(batch)
 
 
 def validate_page_range(page_range: str) -> bool:
-    pattern = r"^(\d+(-\d+)?)(,(\d+(-\d+)?))*$"
-    return bool(re.match(pattern, page_range))
+    return RE_PAGE_RANGE.match(page_range) is not None
 
 
 def parse_page_range(page_range: str, total_pages: int) -> list[int]:
-    pages: set[int] = set()
-    for part in page_range.split(","):
-        if "-" in part:
-            start, end = map(int, part.split("-"))
-            pages.update(range(start, end + 1))
-        else:
-            pages.add(int(part))
-    return sorted(p for p in pages if 1 <= p <= total_pages)
+    if not validate_page_range(page_range):
+        raise ValueError(f"Invalid page range: {page_range!r}")
+    # Page bitmap (index = page number): overlaps are free and the result comes out sorted
+    selected = bytearray(total_pages + 1)
+    for part in RE_PAGE_PART.finditer(page_range):
+        start = int(part[1])
+        end = int(part[2]) if part[2] else start
+        start, end = max(start, 1), min(end, total_pages)
+        if start <= end:
+            selected[start : end + 1] = b"\x01" * (end - start + 1)
+    return [page for page, flag in enumerate(selected) if flag]
 
 
 def format_duration(duration: float) -> str:
@@ -132,21 +169,31 @@ _HEMI_MAP = {
     "BB": "W",
 }
 _HEMI_TOKEN_RE = re.compile(r"\b(LU|LS|BT|BB|[NSEWUTB])\b", re.IGNORECASE)
+# Any token _map_hemispheres would change has one of these (uppercase N/S/E/W map to themselves)
+_HEMI_REMAP_CHAR_RE = re.compile(r"[ULTBultbnsew]")
+
+# Smart quotes / primes -> ASCII, applied in a single str.translate pass
+_QUOTE_TABLE = str.maketrans(
+    {
+        "’": "'",
+        "‘": "'",
+        "′": "'",
+        "“": '"',
+        "”": '"',
+        "″": '"',
+    }
+)
+_DUP_DOUBLE_QUOTE_RE = re.compile(r'"{2,}')
+_DUP_SINGLE_QUOTE_RE = re.compile(r"'{2,}")
 
 
 def _normalize_quotes(s: str) -> str:
-    # Normalize smart quotes / primes to ASCII
-    s = (
-        s.replace("’", "'")
-        .replace("‘", "'")
-        .replace("′", "'")
-        .replace("“", '"')
-        .replace("”", '"')
-        .replace("″", '"')
-    )
-    # Collapse duplicate quotes:  "" -> ",  '' -> '
-    s = re.sub(r'"{2,}', '"', s)
-    s = re.sub(r"'{2,}", "'", s)
+    s = s.translate(_QUOTE_TABLE)
+    # Collapse duplicate quotes:  "" -> ",  '' -> '  (substring checks skip the usual clean case)
+    if '""' in s:
+        s = _DUP_DOUBLE_QUOTE_RE.sub('"', s)
+    if "''" in s:
+        s = _DUP_SINGLE_QUOTE_RE.sub("'", s)
     return s
 
 
@@ -160,31 +207,33 @@ def _map_hemispheres(s: str) -> str:
         tok = m.group(1).upper()
         return _HEMI_MAP.get(tok, tok)
 
+    if not _HEMI_REMAP_CHAR_RE.search(s):
+        return s
     return _HEMI_TOKEN_RE.sub(repl, s)
 
 
-def _format_seconds_two_decimals(sec: str) -> str:
-    # "3" -> "3.00", "3.4" -> "3.40", "3.444" -> "3.44"
-    if "." in sec:
-        whole, frac = sec.split(".", 1)
-    else:
-        whole, frac = sec, ""
-    frac = (frac + "00")[:2]
-    return f"{whole}.{frac}"
+def _format_seconds(whole: str, frac: str | None) -> str:
+    # ("3", None) -> "3.00", ("3", "4") -> "3.40", ("3", "444") -> "3.44"
+    return f"{whole}.{((frac or '') + '00')[:2]}"
 
 
 # One flexible pattern: optional leading hemi OR optional trailing hemi.
 _COORD_RE = re.compile(
     r"""
-    (?:(?P<h1>[NSEW])\s*)?                    # optional leading hemisphere
-    (?P<deg>\d{1,3})\s*°\s*
-    (?P<min>\d{1,2})\s*'\s*
-    (?P<sec>\d{1,2}(?:\.\d+)?)\s*"?\s*        # seconds; optional double-quote in input
-    (?P<h2>[NSEW])?                           # optional trailing hemisphere
+    (?:(?P<h1>[NSEW])\s*)?                              # optional leading hemisphere
+    (?P<deg>[0-9]{1,3})\s*°\s*
+    (?P<min>[0-9]{1,2})\s*'\s*
+    (?P<sec>[0-9]{1,2})(?:\.(?P<frac>[0-9]+))?\s*"?\s*  # seconds; optional double-quote in input
+    (?P<h2>[NSEW])?                                     # optional trailing hemisphere
     """,
     re.VERBOSE,
 )
 
+# Fast path for the common shape "<DMS> N|S <DMS> E|W" (hemispheres trailing).
+# Sub-patterns mirror _COORD_RE so a full match yields exactly what the finditer loop would.
+_DMS = r"([0-9]{1,3})\s*°\s*([0-9]{1,2})\s*'\s*([0-9]{1,2})(?:\.([0-9]+))?\s*\"?\s*"
+_COORD_PAIR_RE = re.compile(_DMS + r"([NS])\s*" + _DMS + r"([EW])")
+
 
 def format_coordinate(cell: str) -> str:
     """
@@ -201,6 +250,15 @@ def format_coordinate(cell: str) -> str:
 
     s = _normalize_spaces(_map_hemispheres(_normalize_quotes(cell)))
 
+    pair = _COORD_PAIR_RE.fullmatch(s)
+    if pair:
+        lat_deg, lat_min, lat_sec, lat_frac, lat_hemi, *lon_parts = pair.groups()
+        lon_deg, lon_min, lon_sec, lon_frac, lon_hemi = lon_parts
+        return (
+            f"{lat_deg}°{lat_min}'{_format_seconds(lat_sec, lat_frac)}\" {lat_hemi} "
+            f"{lon_deg}°{lon_min}'{_format_seconds(lon_sec, lon_frac)}\" {lon_hemi}"
+        )
+
     lat: str | None = None
     lon: str | None = None
 
@@ -208,14 +266,15 @@ def format_coordinate(cell: str) -> str:
         hemi = m.group("h1") or m.group("h2")
         if not hemi:
             continue
-        deg, minutes, secs = m.group("deg"), m.group("min"), m.group("sec")
-        secs = _format_seconds_two_decimals(secs)
-        canonical = f"{deg}°{minutes}'{secs}\" {hemi}"
+        deg, minutes, secs, frac = m.group("deg", "min", "sec", "frac")
+        canonical = f"{deg}°{minutes}'{_format_seconds(secs, frac)}\" {hemi}"
 
         if hemi in ("N", "S") and lat is None:
             lat = canonical
         elif hemi in ("E", "W") and lon is None:
             lon = canonical
+        if lat and lon:
+            break  # later matches can no longer change the result
 
     if lat and lon:
         return f"{lat} {lon}"
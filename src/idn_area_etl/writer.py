@@ -3,6 +3,36 @@ from pathlib import Path
 from types import TracebackType
 from typing import Any, Iterable
 
+# Separators used to join rows in one pass before swapping in the CSV ones
+_FIELD_SEP = "\x1f"
+_ROW_SEP = "\x1e"
+# Characters that make the default csv dialect quote a field
+_QUOTE_TRIGGERS = (",", '"', "\r", "\n")
+
+
+def _join_plain_rows(rows: list[Iterable[Any]]) -> str | None:
+    """
+    Render rows exactly as csv.writer would, if no field needs quoting.
+    Return None (caller falls back to csv.writer) for anything else.
+    """
+    fields = 0
+    for row in rows:
+        # lists/tuples can be re-read on fallback; a lone "" field gets quoted by csv
+        if not isinstance(row, (list, tuple)) or len(row) < 2:
+            return None
+        fields += len(row)
+    try:
+        body = _ROW_SEP.join([_FIELD_SEP.join(row) for row in rows])
+    except TypeError:  # non-str cells: let csv stringify them
+        return None
+    if (
+        body.count(_FIELD_SEP) != fields - len(rows)
+        or body.count(_ROW_SEP) != len(rows) - 1
+        or any(char in body for char in _QUOTE_TRIGGERS)
+    ):
+        return None
+    return body.replace(_FIELD_SEP, ",").replace(_ROW_SEP, "\r\n") + "\r\n"
+
 
 class OutputWriter:
     """
@@ -64,7 +94,11 @@ class OutputWriter:
         if self._writer is None or self._file_handler is None:
             raise RuntimeError("OutputWriter is not open")
 
-        self._writer.writerows(self._buffer)
+        text = _join_plain_rows(self._buffer)
+        if text is None:
+            self._writer.writerows(self._buffer)
+        else:
+            self._file_handler.write(text)
         self._file_handler.flush()
         self._buffer.clear()
 
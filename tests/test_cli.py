@@ -1,116 +1,172 @@
 import os
 from pathlib import Path
-from typing import Any
+import shutil
+from typing import Any, Callable, Iterator
 import signal
 
 import pandas as pd
 import pytest
 import typer
 
-from idn_area_etl.cli import extract, version_option_callback, handle_sigint
+from idn_area_etl import cli as cli_mod
+from idn_area_etl.cli import extract, main, version_option_callback, handle_sigint
 from idn_area_etl.config import Config, ConfigError
 
 
+# Header-only PDF payload; tests stub PdfReader/camelot, so only existence + suffix matter
+_FAKE_PDF_BYTES = b"%PDF-1.4\n%fake"
+
+
 class _StubTable:
     def __init__(self, df: pd.DataFrame) -> None:
         self.df = df
 
 
-def _df_area_min():
-    return pd.DataFrame(
+# Built once at import; tests and extractors only read them, so helpers hand out shallow copies
+_AREA_DF = pd.DataFrame(
+    [
+        [
+            "K O D E",
+            "NAMA PROVINSI / KABUPATEN / KOTA",
+            "JUMLAH",
+            "",
+            "N A M A / J U M L A H",
+            "",
+            "",
+            "LUAS WILAYAH (Km2)",
+            "K E T E R A N G A N",
+        ],
+        ["", "KAB", "KOTA", "KECAMATAN", "KELURAHAN", "D E S A", "", "", ""],
+        [
+            "11",
+            "Aceh",
+            "",
+            "",
+            "",
+            "",
+            "",
+            "",
+            "...",
+        ],
         [
-            [
-                "K O D E",
-                "NAMA PROVINSI / KABUPATEN / KOTA",
-                "JUMLAH",
-                "",
-                "N A M A / J U M L A H",
-                "",
-                "",
-                "LUAS WILAYAH (Km2)",
-                "K E T E R A N G A N",
-            ],
-            ["", "KAB", "KOTA", "KECAMATAN", "KELURAHAN", "D E S A", "", "", ""],
-            [
-                "11",
-                "Aceh",
-                "",
-                "",
-                "",
-                "",
-                "",
-                "",
-                "...",
-            ],
-            [
-                "11.01",
-                "Kabupaten Aceh Selatan",
-                "18",
-                "0",
-                "260",
-                "",
-                "4.174,211",
-                "...",
-            ],
-        ]
-    )
-
-
-def _df_island_min():
-    return pd.DataFrame(
+            "11.01",
+            "Kabupaten Aceh Selatan",
+            "18",
+            "0",
+            "260",
+            "",
+            "4.174,211",
+            "...",
+        ],
+    ]
+)
+
+_ISLAND_DF = pd.DataFrame(
+    [
         [
-            [
-                "Kode Pulau",
-                "Nama Provinsi, Kabupaten/Kota, Pulau",
-                "Jumlah",
-                "Koordinat",
-                "Luas\n2\n(Km )",
-                "BP/TBP",
-                "Keterangan",
-            ],
-            ["11.01", "Kabupaten Aceh Selatan", "6", "", "", "", ""],
-            [
-                "11.01.40001",
-                "Pulau Batukapal",
-                "",
-                "03°19'03.44\" U 097°07'41.73\" T",
-                "0.0006",
-                "TBP",
-                "",
-            ],
-        ]
-    )
+            "Kode Pulau",
+            "Nama Provinsi, Kabupaten/Kota, Pulau",
+            "Jumlah",
+            "Koordinat",
+            "Luas\n2\n(Km )",
+            "BP/TBP",
+            "Keterangan",
+        ],
+        ["11.01", "Kabupaten Aceh Selatan", "6", "", "", "", ""],
+        [
+            "11.01.40001",
+            "Pulau Batukapal",
+            "",
+            "03°19'03.44\" U 097°07'41.73\" T",
+            "0.0006",
+            "TBP",
+            "",
+        ],
+    ]
+)
+
+# Matches no extractor, so extract() never touches it
+_UNMATCHED_DF = pd.DataFrame([["Foo", "Bar"], ["1", "2"]])
+
+
+def _df_area_min() -> pd.DataFrame:
+    return _AREA_DF.copy(deep=False)
+
+
+def _df_island_min() -> pd.DataFrame:
+    return _ISLAND_DF.copy(deep=False)
+
+
+@pytest.fixture(autouse=True)
+def _reset_interrupted() -> Iterator[None]:
+    """Keep the module-level SIGINT flag from leaking between tests."""
+    cli_mod.interrupted = False
+    yield
+    cli_mod.interrupted = False
+
+
+@pytest.fixture(scope="session")
+def fake_pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One shared `.pdf` file for tests that only need an existing input path (do not modify)."""
+    pdf_path = tmp_path_factory.mktemp("pdf") / "input.pdf"
+    pdf_path.write_bytes(_FAKE_PDF_BYTES)
+    return pdf_path
+
+
+def _link_fake_pdf(fake_pdf: Path, target: Path) -> Path:
+    """Give the shared fake PDF another name (hard link, or a copy where links are unsupported)."""
+    try:
+        target.hardlink_to(fake_pdf)
+    except OSError:
+        shutil.copyfile(fake_pdf, target)
+    return target
+
+
+class _StubReader:
+    """PdfReader stand-in: only the page count is used by extract()."""
+
+    def __init__(self, n_pages: int) -> None:
+        self.pages = [object()] * n_pages
+
+
+ReadPdf = Callable[..., list[_StubTable]]
+
+
+@pytest.fixture()
+def stub_pdf(monkeypatch: pytest.MonkeyPatch) -> Callable[[int, ReadPdf], None]:
+    """
+    Return an installer that stubs PdfReader with `n_pages` pages and camelot.read_pdf
+    with the given callable, so tests never parse a real PDF.
+    """
+
+    def install(n_pages: int, read_pdf: ReadPdf) -> None:
+        def _reader(*_: Any, **__: Any) -> _StubReader:
+            return _StubReader(n_pages)
+
+        monkeypatch.setattr(cli_mod, "PdfReader", _reader)
+        monkeypatch.setattr(cli_mod.camelot, "read_pdf", read_pdf)
+
+    return install
+
+
+def _read_area_and_island(*_: Any, **__: Any) -> list[_StubTable]:
+    return [_StubTable(_df_area_min()), _StubTable(_df_island_min())]
 
 
 class TestExtractFunction:
     """Integration-ish tests for the public extract() function."""
 
+    @pytest.mark.slow
     def test_extract_writes_outputs_when_tables_match(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, tmp_path: Path, fake_pdf: Path, stub_pdf: Callable[[int, ReadPdf], None]
     ):
-        # Stub PdfReader to avoid real PDF parsing
-        class _StubReader:
-            def __init__(self, *_: Any, **__: Any) -> None:
-                self.pages = [object(), object()]  # 2 pages
-
-        # Stub camelot.read_pdf to return our fake tables regardless of pages arg
-        def _stub_read_pdf(_path: str, pages: str, flavor: str, parallel: bool):
-            return [
-                _StubTable(_df_area_min()),
-                _StubTable(_df_island_min()),
-            ]
+        # 2 pages; camelot returns our fake tables regardless of pages arg
+        stub_pdf(2, _read_area_and_island)
 
-        from idn_area_etl import cli as cli_mod
-
-        monkeypatch.setattr(cli_mod, "PdfReader", _StubReader)
-        monkeypatch.setattr(cli_mod.camelot, "read_pdf", _stub_read_pdf)
-
-        pdf_file = tmp_path / "input.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n%fake")  # existence + suffix only
         dest = tmp_path / "out"
 
         extract(
-            pdf_path=pdf_file,
+            pdf_path=fake_pdf,
             chunk_size=2,
             page_range=None,  # will use StubReader.pages -> [1, 2]
             output="result",
@@ -125,31 +181,18 @@ class TestExtractFunction:
         assert (dest / "result.island.csv").exists()
 
         # Quick content check
-        assert "Aceh" in (dest / "result.province.csv").read_text(encoding="utf-8")
-        assert "Kabupaten Aceh Selatan" in (dest / "result.regency.csv").read_text(encoding="utf-8")
-        assert "Pulau Batukapal" in (dest / "result.island.csv").read_text(encoding="utf-8")
+        assert b"Aceh" in (dest / "result.province.csv").read_bytes()
+        assert b"Kabupaten Aceh Selatan" in (dest / "result.regency.csv").read_bytes()
+        assert b"Pulau Batukapal" in (dest / "result.island.csv").read_bytes()
 
+    @pytest.mark.slow
     def test_extract_uses_pdf_stem_when_output_empty_or_none(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, tmp_path: Path, fake_pdf: Path, stub_pdf: Callable[[int, ReadPdf], None]
     ):
         # Test that empty output or None falls back to pdf_path.stem
-        class _StubReader:
-            def __init__(self, *_: Any, **__: Any) -> None:
-                self.pages = [object(), object()]  # 2 pages
+        stub_pdf(2, _read_area_and_island)
 
-        def _stub_read_pdf(_path: str, pages: str, flavor: str, parallel: bool):
-            return [
-                _StubTable(_df_area_min()),
-                _StubTable(_df_island_min()),
-            ]
-
-        from idn_area_etl import cli as cli_mod
-
-        monkeypatch.setattr(cli_mod, "PdfReader", _StubReader)
-        monkeypatch.setattr(cli_mod.camelot, "read_pdf", _stub_read_pdf)
-
-        pdf_file = tmp_path / "my_test_file.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n%fake")
+        pdf_file = _link_fake_pdf(fake_pdf, tmp_path / "my_test_file.pdf")
         dest = tmp_path / "out"
 
         # Test with empty string output
@@ -168,34 +211,29 @@ class TestExtractFunction:
         assert (dest / "my_test_file.regency.csv").exists()
         assert (dest / "my_test_file.island.csv").exists()
 
-        # Clean up for next test
-        for f in dest.glob("*.csv"):
-            f.unlink()
-
-        # Test with None output (default)
+        # Test with None output (default), into a fresh directory
+        dest2 = tmp_path / "out2"
         extract(
             pdf_path=pdf_file,
             chunk_size=2,
             page_range=None,
             output=None,  # None should also fallback to pdf stem
-            destination=dest,
+            destination=dest2,
             parallel=False,
             version=None,
         )
 
         # Should also use pdf stem "my_test_file" as output name
-        assert (dest / "my_test_file.province.csv").exists()
-        assert (dest / "my_test_file.regency.csv").exists()
-        assert (dest / "my_test_file.island.csv").exists()
+        assert (dest2 / "my_test_file.province.csv").exists()
+        assert (dest2 / "my_test_file.regency.csv").exists()
+        assert (dest2 / "my_test_file.island.csv").exists()
 
-    def test_extract_fails_when_output_only_whitespaces(self, tmp_path: Path):
-        pdf_file = tmp_path / "input.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n%fake")
+    def test_extract_fails_when_output_only_whitespaces(self, tmp_path: Path, fake_pdf: Path):
         dest = tmp_path / "out"
 
         with pytest.raises(typer.Exit) as e:
             extract(
-                pdf_path=pdf_file,
+                pdf_path=fake_pdf,
                 chunk_size=2,
                 page_range=None,
                 output="   ",  # Only whitespace
@@ -205,28 +243,19 @@ class TestExtractFunction:
             )
         assert e.value.exit_code == 1  # "Invalid output name."
 
+    @pytest.mark.slow
     def test_extract_fails_when_no_matching_tables(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, tmp_path: Path, fake_pdf: Path, stub_pdf: Callable[[int, ReadPdf], None]
     ):
-        class _StubReader:
-            def __init__(self, *_: Any, **__: Any) -> None:
-                self.pages = [object()]  # 1 page
-
         def _stub_read_pdf(_path: str, pages: str, flavor: str, parallel: bool):
             # Table not recognized by any extractor
-            return [_StubTable(pd.DataFrame([["Foo", "Bar"], ["1", "2"]]))]
+            return [_StubTable(_UNMATCHED_DF)]
 
-        from idn_area_etl import cli as cli_mod
-
-        monkeypatch.setattr(cli_mod, "PdfReader", _StubReader)
-        monkeypatch.setattr(cli_mod.camelot, "read_pdf", _stub_read_pdf)
-
-        pdf_file = tmp_path / "input.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n%fake")
+        stub_pdf(1, _stub_read_pdf)
 
         with pytest.raises(typer.Exit) as e:
             extract(
-                pdf_path=pdf_file,
+                pdf_path=fake_pdf,
                 chunk_size=1,
                 page_range="1",
                 output="none",
@@ -236,10 +265,10 @@ class TestExtractFunction:
             )
         assert e.value.exit_code == 1  # "No matching data found."
 
-    def test_extract_rejects_bad_inputs(self, tmp_path: Path):
+    def test_extract_rejects_bad_inputs(self, tmp_path: Path, fake_pdf: Path):
         # Non-PDF path
         not_pdf = tmp_path / "input.txt"
-        not_pdf.write_text("hello")
+        not_pdf.touch()
         with pytest.raises(typer.Exit):
             extract(
                 pdf_path=not_pdf,
@@ -252,11 +281,9 @@ class TestExtractFunction:
             )
 
         # Bad page range
-        pdf_file = tmp_path / "x.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n%fake")
         with pytest.raises(typer.Exit):
             extract(
-                pdf_path=pdf_file,
+                pdf_path=fake_pdf,
                 chunk_size=1,
                 page_range="1,,3",
                 output="ok",
@@ -265,33 +292,30 @@ class TestExtractFunction:
                 version=None,
             )
 
-    def test_extract_rejects_invalid_output_characters(self, tmp_path: Path):
+    @pytest.mark.parametrize("char", list(r'\/:*?"<>|'))
+    def test_extract_rejects_invalid_output_characters(
+        self, tmp_path: Path, fake_pdf: Path, char: str
+    ):
         # Invalid characters in output name
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n%fake")
-        invalid_chars = r'\/:*?"<>|'
-        for char in invalid_chars:
-            with pytest.raises(typer.Exit):
-                extract(
-                    pdf_path=pdf_file,
-                    chunk_size=1,
-                    page_range=None,
-                    output=f"output{char}name",
-                    destination=tmp_path,
-                    parallel=False,
-                    version=None,
-                )
-
-    def test_extract_rejects_file_as_destination(self, tmp_path: Path):
+        with pytest.raises(typer.Exit):
+            extract(
+                pdf_path=fake_pdf,
+                chunk_size=1,
+                page_range=None,
+                output=f"output{char}name",
+                destination=tmp_path,
+                parallel=False,
+                version=None,
+            )
+
+    def test_extract_rejects_file_as_destination(self, tmp_path: Path, fake_pdf: Path):
         # File path as destination (not directory)
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n%fake")
         dest_file = tmp_path / "dest.txt"
-        dest_file.write_text("not a directory")
+        dest_file.touch()
 
         with pytest.raises(typer.Exit):
             extract(
-                pdf_path=pdf_file,
+                pdf_path=fake_pdf,
                 chunk_size=1,
                 page_range=None,
                 output="ok",
@@ -300,28 +324,22 @@ class TestExtractFunction:
                 version=None,
             )
 
-    def test_extract_handles_camelot_error(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    @pytest.mark.slow
+    def test_extract_handles_camelot_error(
+        self, tmp_path: Path, fake_pdf: Path, stub_pdf: Callable[[int, ReadPdf], None]
+    ):
         # Test error handling when camelot.read_pdf fails
-        class _StubReader:
-            def __init__(self, *_: Any, **__: Any) -> None:
-                self.pages = [object()]
-
         def _stub_read_pdf_error(_path: str, pages: str, flavor: str, parallel: bool):
             raise Exception("Camelot parsing error")
 
-        from idn_area_etl import cli as cli_mod
-
-        monkeypatch.setattr(cli_mod, "PdfReader", _StubReader)
-        monkeypatch.setattr(cli_mod.camelot, "read_pdf", _stub_read_pdf_error)
+        stub_pdf(1, _stub_read_pdf_error)
 
-        pdf_file = tmp_path / "input.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n%fake")
         dest = tmp_path / "out"
 
         # Should still exit with code 1 due to no matching data found
         with pytest.raises(typer.Exit) as e:
             extract(
-                pdf_path=pdf_file,
+                pdf_path=fake_pdf,
                 chunk_size=1,
                 page_range=None,
                 output="result",
@@ -331,16 +349,19 @@ class TestExtractFunction:
             )
         assert e.value.exit_code == 1
 
-    def test_extract_handles_extractor_error(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    @pytest.mark.slow
+    def test_extract_handles_extractor_error(
+        self,
+        tmp_path: Path,
+        fake_pdf: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        stub_pdf: Callable[[int, ReadPdf], None],
+    ):
         # Test error handling when extractor fails
-        class _StubReader:
-            def __init__(self, *_: Any, **__: Any) -> None:
-                self.pages = [object()]
-
         def _stub_read_pdf(_path: str, pages: str, flavor: str, parallel: bool):
             return [_StubTable(_df_area_min())]
 
-        from idn_area_etl import cli as cli_mod
+        stub_pdf(1, _stub_read_pdf)
 
         # Mock AreaExtractor to raise exception
         original_area_extractor = cli_mod.AreaExtractor
@@ -349,18 +370,14 @@ class TestExtractFunction:
             def extract_and_write(self, df: pd.DataFrame) -> int:
                 raise Exception("Extractor processing error")
 
-        monkeypatch.setattr(cli_mod, "PdfReader", _StubReader)
-        monkeypatch.setattr(cli_mod.camelot, "read_pdf", _stub_read_pdf)
         monkeypatch.setattr(cli_mod, "AreaExtractor", _ErrorAreaExtractor)
 
-        pdf_file = tmp_path / "input.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n%fake")
         dest = tmp_path / "out"
 
         # Should continue processing despite extractor error but eventually exit with no data
         with pytest.raises(typer.Exit) as e:
             extract(
-                pdf_path=pdf_file,
+                pdf_path=fake_pdf,
                 chunk_size=1,
                 page_range=None,
                 output="result",
@@ -370,13 +387,11 @@ class TestExtractFunction:
             )
         assert e.value.exit_code == 1
 
-    def test_extract_handles_config_error(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
-        pdf_file = tmp_path / "input.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n%fake")
+    def test_extract_handles_config_error(
+        self, tmp_path: Path, fake_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         dest = tmp_path / "out"
 
-        from idn_area_etl import cli as cli_mod
-
         class _FailingAppConfig:
             @classmethod
             def load(cls, *args: object, **kwargs: object) -> Config:
@@ -386,7 +401,7 @@ class TestExtractFunction:
 
         with pytest.raises(typer.Exit) as exc_info:
             cli_mod.extract(
-                pdf_path=pdf_file,
+                pdf_path=fake_pdf,
                 chunk_size=1,
                 page_range=None,
                 output="ok",
@@ -401,75 +416,43 @@ class TestExtractFunction:
 class TestSignalHandler:
     """Tests for the signal handler function."""
 
-    def test_handle_sigint_sets_interrupted_flag(self, monkeypatch: pytest.MonkeyPatch):
-        from idn_area_etl import cli as cli_mod
-
-        # Reset interrupted flag
-        cli_mod.interrupted = False
-
+    def test_handle_sigint_sets_interrupted_flag(
+        self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ):
         # Mock os.getpid to return MAIN_PID
         monkeypatch.setattr(os, "getpid", lambda: cli_mod.MAIN_PID)
 
-        # Mock typer.echo to capture output
-        echo_calls: list[str] = []
-
-        def mock_echo(msg: str) -> None:
-            echo_calls.append(msg)
-
-        monkeypatch.setattr(typer, "echo", mock_echo)
-
         # Call signal handler
         handle_sigint(signal.SIGINT, None)
 
         # Verify interrupted flag is set
         assert cli_mod.interrupted is True
 
-        # Verify echo was called with abort message
-        assert len(echo_calls) == 1
-        assert "Aborted by user" in echo_calls[0]
-
-    def test_handle_sigint_different_pid(self, monkeypatch: pytest.MonkeyPatch):
-        from idn_area_etl import cli as cli_mod
-
-        # Reset interrupted flag
-        cli_mod.interrupted = False
+        # Verify the abort message was printed once
+        out = capsys.readouterr().out
+        assert out.count("Aborted by user") == 1
 
+    def test_handle_sigint_different_pid(
+        self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ):
         # Mock os.getpid to return different PID
         monkeypatch.setattr(os, "getpid", lambda: cli_mod.MAIN_PID + 1)
 
-        # Mock typer.echo to capture output
-        echo_calls: list[str] = []
-
-        def mock_echo(msg: str) -> None:
-            echo_calls.append(msg)
-
-        monkeypatch.setattr(typer, "echo", mock_echo)
-
         # Call signal handler
         handle_sigint(signal.SIGINT, None)
 
-        # Verify interrupted flag is set but no echo called
+        # Verify interrupted flag is set but nothing printed
         assert cli_mod.interrupted is True
-        assert len(echo_calls) == 0
+        assert capsys.readouterr().out == ""
 
+    @pytest.mark.slow
     def test_extract_breaks_on_interrupt_branch(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, tmp_path: Path, fake_pdf: Path, stub_pdf: Callable[[int, ReadPdf], None]
     ):
         """
         Ensure the True-branch of `if interrupted: break` is executed.
         We flip the `interrupted` flag during the first chunk so the second chunk hits `break`.
         """
-        from idn_area_etl import cli as cli_mod
-
-        class _StubReader:
-            def __init__(self, *_: object, **__: object) -> None:
-                # 4 pages -> with chunk_size=1, we get multiple iterations
-                self.pages = [object(), object(), object(), object()]
-
-        # Reset flag & stub PdfReader
-        cli_mod.interrupted = False
-        monkeypatch.setattr(cli_mod, "PdfReader", _StubReader)
-
         # Stub camelot.read_pdf: on first call, flip `interrupted=True`
         call_count = {"n": 0}
 
@@ -477,28 +460,23 @@ class TestSignalHandler:
             call_count["n"] += 1
             if call_count["n"] == 1:
                 cli_mod.interrupted = True  # will affect the *next* loop iteration
-            return [type("T", (), {"df": _df_area_min()})()]  # one table with minimal area df
+            return [_StubTable(_df_area_min())]  # one table with minimal area df
 
-        monkeypatch.setattr(cli_mod.camelot, "read_pdf", _stub_read_pdf)
+        # 4 pages -> with chunk_size=1, we get multiple iterations
+        stub_pdf(4, _stub_read_pdf)
 
         # Run extract
-        pdf_file = tmp_path / "in.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n%fake")  # existence + suffix check only
         dest = tmp_path / "out"
 
-        try:
-            cli_mod.extract(
-                pdf_path=pdf_file,
-                chunk_size=1,  # ensure many loop iterations
-                page_range=None,
-                output="x",
-                destination=dest,
-                parallel=False,
-                version=None,
-            )
-        finally:
-            # Always reset the global flag so other tests aren't affected
-            cli_mod.interrupted = False
+        cli_mod.extract(
+            pdf_path=fake_pdf,
+            chunk_size=1,  # ensure many loop iterations
+            page_range=None,
+            output="x",
+            destination=dest,
+            parallel=False,
+            version=None,
+        )
 
         # Assert that we actually stopped early: read_pdf called only once
         assert call_count["n"] == 1, "Expected to break on the 2nd iteration (after 1 read)."
@@ -513,8 +491,6 @@ class TestVersionOptionCallback:
     def test_version_prints_and_exits_successfully(
         self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
     ):
-        from idn_area_etl import cli as cli_mod
-
         def _fake_version(_: str) -> str:
             return "1.2.3"
 
@@ -528,7 +504,6 @@ class TestVersionOptionCallback:
         self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
     ):
         from importlib.metadata import PackageNotFoundError
-        from idn_area_etl import cli as cli_mod
 
         def _raise(_: str) -> None:
             raise PackageNotFoundError()
@@ -538,3 +513,29 @@ class TestVersionOptionCallback:
             version_option_callback(True)
         assert e.value.exit_code == 1
         assert "Version information not available" in capsys.readouterr().out
+
+
+class TestMain:
+    """Tests for the in-process main() entry point."""
+
+    @pytest.mark.slow
+    def test_returns_zero_on_success(
+        self, tmp_path: Path, fake_pdf: Path, stub_pdf: Callable[[int, ReadPdf], None]
+    ):
+        stub_pdf(1, _read_area_and_island)
+        dest = tmp_path / "out"
+
+        assert main([str(fake_pdf), "--destination", str(dest), "--output", "result"]) == 0
+        assert (dest / "result.province.csv").exists()
+
+    def test_returns_exit_code_of_failed_run(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ):
+        not_pdf = tmp_path / "input.txt"
+        not_pdf.touch()
+
+        assert main([str(not_pdf)]) == 1
+        assert "must be a PDF" in capsys.readouterr().out
+
+    def test_returns_usage_error_code_for_missing_file(self, tmp_path: Path):
+        assert main([str(tmp_path / "absent.pdf")]) == 2
@@ -1,9 +1,21 @@
+from collections.abc import Mapping
+from dataclasses import FrozenInstanceError
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import pytest
 
-from idn_area_etl.config import AppConfig, ConfigError, DataConfig, FileLoader
+from idn_area_etl import config as config_mod
+from idn_area_etl.config import (
+    AppConfig,
+    ConfigError,
+    DataConfig,
+    FileLoader,
+    RtomlLoader,
+    TomlLoader,
+    default_loader,
+)
 
 
 class StubLoader(FileLoader):
@@ -28,28 +40,36 @@ def _touch_config(tmp_path: Path) -> Path:
     return cfg_path
 
 
-def _base_area_config(**overrides: object) -> dict[str, Any]:
-    data: dict[str, Any] = {
-        "batch_size": 8,
-        "output_headers": ["code", "name"],
-        "filename_suffix": "province",
-    }
-    data.update(overrides)
-    return data
+@pytest.fixture(scope="class")
+def base_area_config() -> Mapping[str, Any]:
+    """Valid area section shared by the class; read-only, tests merge overrides on top."""
+    return MappingProxyType(
+        {
+            "batch_size": 8,
+            "output_headers": ("code", "name"),
+            "filename_suffix": "province",
+        }
+    )
 
 
 class TestDataConfigValidation:
-    def test_requires_positive_batch_size(self) -> None:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            dict(batch_size=0, output_headers=("code",), filename_suffix="province"),
+            dict(batch_size=1, output_headers=("code",), filename_suffix=""),
+            dict(batch_size=1, output_headers=(), filename_suffix="province"),
+        ],
+        ids=["batch_size", "filename_suffix", "output_headers"],
+    )
+    def test_rejects_invalid_values(self, kwargs: dict[str, Any]) -> None:
         with pytest.raises(ValueError):
-            DataConfig(batch_size=0, output_headers=("code",), filename_suffix="province")
+            DataConfig(**kwargs)
 
-    def test_requires_non_empty_filename_suffix(self) -> None:
-        with pytest.raises(ValueError):
-            DataConfig(batch_size=1, output_headers=("code",), filename_suffix="")
-
-    def test_requires_non_empty_headers(self) -> None:
-        with pytest.raises(ValueError):
-            DataConfig(batch_size=1, output_headers=(), filename_suffix="province")
+    def test_is_immutable(self) -> None:
+        data_config = DataConfig(batch_size=1, output_headers=("code",), filename_suffix="p")
+        with pytest.raises(FrozenInstanceError):
+            data_config.batch_size = 2  # pyright: ignore[reportAttributeAccessIssue]
 
 
 class TestAppConfigLoad:
@@ -99,23 +119,20 @@ class TestAppConfigLoad:
         cfg = AppConfig.load(cfg_path, loader=StubLoader(payload=payload))
         assert set(cfg.data["island"].output_headers) == {"code", "name", "coordinate"}
 
-    def test_none_headers_raise_config_error(self, tmp_path: Path) -> None:
-        cfg_path = _touch_config(tmp_path)
-        payload = {"data": {"province": _base_area_config(output_headers=None)}}
-
-        with pytest.raises(ConfigError):
-            AppConfig.load(cfg_path, loader=StubLoader(payload=payload))
-
-    def test_invalid_headers_type_raise_config_error(self, tmp_path: Path) -> None:
-        cfg_path = _touch_config(tmp_path)
-        payload = {"data": {"province": _base_area_config(output_headers=123)}}
-
-        with pytest.raises(ConfigError):
-            AppConfig.load(cfg_path, loader=StubLoader(payload=payload))
-
-    def test_invalid_dataconfig_value_is_wrapped(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"output_headers": None},
+            {"output_headers": 123},
+            {"batch_size": 0},
+        ],
+        ids=["none_headers", "invalid_headers_type", "invalid_dataconfig_value"],
+    )
+    def test_invalid_area_config_raises_config_error(
+        self, tmp_path: Path, base_area_config: Mapping[str, Any], overrides: dict[str, object]
+    ) -> None:
         cfg_path = _touch_config(tmp_path)
-        payload = {"data": {"province": _base_area_config(batch_size=0)}}
+        payload = {"data": {"province": {**base_area_config, **overrides}}}
 
         with pytest.raises(ConfigError):
             AppConfig.load(cfg_path, loader=StubLoader(payload=payload))
@@ -132,3 +149,23 @@ class TestAppConfigLoad:
 
         with pytest.raises(ConfigError):
             AppConfig.load(cfg_path, loader=StubLoader(payload=payload))
+
+class TestDefaultLoader:
+    def test_falls_back_to_tomllib_without_rtoml(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def _find_spec(name: str) -> None:
+            return None
+
+        monkeypatch.setattr(config_mod, "find_spec", _find_spec)
+        assert isinstance(default_loader(), TomlLoader)
+
+    def test_prefers_rtoml_when_installed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def _find_spec(name: str) -> object:
+            return object()
+
+        monkeypatch.setattr(config_mod, "find_spec", _find_spec)
+        assert isinstance(default_loader(), RtomlLoader)
+
+    def test_rtoml_matches_tomllib(self) -> None:
+        pytest.importorskip("rtoml")
+        cfg_path = Path(__file__).parents[1] / "idnareaetl.toml"
+        assert RtomlLoader().load(cfg_path) == TomlLoader().load(cfg_path)
@@ -1,10 +1,15 @@
+import contextlib
+import io
 import os
 import sys
 import subprocess
 from pathlib import Path
+from typing import Callable
 
 import pytest
 
+from idn_area_etl.cli import main
+
 
 def _read_text_exact(path: Path) -> str:
     """
@@ -21,71 +26,74 @@ def _assert_csv_equal_as_text(expected: Path, actual: Path) -> None:
     assert act == exp, f"CSV differs: {actual.name}"
 
 
-@pytest.mark.e2e
-def test_cli_e2e_extract_matches_expected(tmp_path: Path) -> None:
-    fixtures = Path(__file__).parent / "fixtures"
-    pdf_path = fixtures / "target_tables.pdf"
-    assert pdf_path.exists(), "Missing fixture: tests/fixtures/target_tables.pdf"
+REPO_ROOT = Path(__file__).resolve().parents[1]
+FIXTURES = REPO_ROOT / "tests" / "fixtures"
+AREAS = ("province", "regency", "district", "village", "island")
 
-    expected_files = {
-        "province": fixtures / "expected_province.csv",
-        "regency": fixtures / "expected_regency.csv",
-        "district": fixtures / "expected_district.csv",
-        "village": fixtures / "expected_village.csv",
-        "island": fixtures / "expected_island.csv",
-    }
-    for key, p in expected_files.items():
-        assert p.exists(), f"Missing golden file for {key}: {p}"
 
+def _run_subprocess(args: list[str]) -> tuple[int, str]:
+    """Run the CLI as a real subprocess: the packaging/invocation check."""
     # Build environment for subprocess; ensure 'src' is importable if not installed
-    repo_root = Path(__file__).resolve().parents[1]
-    src_dir = repo_root / "src"
+    src_dir = REPO_ROOT / "src"
     env = os.environ.copy()
     env["PYTHONPATH"] = (
         (str(src_dir) + os.pathsep + env["PYTHONPATH"])
         if "PYTHONPATH" in env and env["PYTHONPATH"]
         else str(src_dir)
     )
-
-    output_name = "e2e"
-    cmd = [
-        sys.executable,
-        "-m",
-        "idn_area_etl.cli",
-        str(pdf_path),
-        "--destination",
-        str(tmp_path),
-        "--output",
-        output_name,
-        "--chunk-size",
-        "3",
-    ]
-
-    # Run the CLI as a real subprocess
     proc = subprocess.run(
-        cmd,
+        [sys.executable, "-m", "idn_area_etl.cli", *args],
         env=env,
-        cwd=str(repo_root),
+        cwd=str(REPO_ROOT),
         text=True,
         capture_output=True,
         check=False,
     )
+    return proc.returncode, f"--- STDOUT ---\n{proc.stdout}\n--- STDERR ---\n{proc.stderr}\n"
+
+
+def _run_inprocess(args: list[str]) -> tuple[int, str]:
+    """Run the CLI through cli.main, skipping interpreter startup."""
+    # The test's cwd is not guaranteed to be the repo root, so point at the config explicitly
+    args = [*args, "--config", str(REPO_ROOT / "idnareaetl.toml")]
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        exit_code = main(args)
+    return exit_code, f"--- STDOUT ---\n{stdout.getvalue()}\n--- STDERR ---\n{stderr.getvalue()}\n"
 
-    assert proc.returncode == 0, (
-        f"CLI failed (exit={proc.returncode})\n"
-        f"--- STDOUT ---\n{proc.stdout}\n"
-        f"--- STDERR ---\n{proc.stderr}\n"
+
+@pytest.mark.e2e
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "run_cli", [_run_subprocess, _run_inprocess], ids=["subprocess", "inprocess"]
+)
+def test_cli_e2e_extract_matches_expected(
+    tmp_path: Path, run_cli: Callable[[list[str]], tuple[int, str]]
+) -> None:
+    pdf_path = FIXTURES / "target_tables.pdf"
+    assert pdf_path.exists(), "Missing fixture: tests/fixtures/target_tables.pdf"
+
+    expected_files = {key: FIXTURES / f"expected_{key}.csv" for key in AREAS}
+    for key, p in expected_files.items():
+        assert p.exists(), f"Missing golden file for {key}: {p}"
+
+    output_name = "e2e"
+    exit_code, output = run_cli(
+        [
+            str(pdf_path),
+            "--destination",
+            str(tmp_path),
+            "--output",
+            output_name,
+            "--chunk-size",
+            "3",
+        ]
     )
+    assert exit_code == 0, f"CLI failed (exit={exit_code})\n{output}"
 
-    actual_files = {
-        "province": tmp_path / f"{output_name}.province.csv",
-        "regency": tmp_path / f"{output_name}.regency.csv",
-        "district": tmp_path / f"{output_name}.district.csv",
-        "village": tmp_path / f"{output_name}.village.csv",
-        "island": tmp_path / f"{output_name}.island.csv",
-    }
+    actual_files = {key: tmp_path / f"{output_name}.{key}.csv" for key in AREAS}
     for key, p in actual_files.items():
         assert p.exists(), f"Missing CLI output for {key}: {p}"
 
-    for key in actual_files.keys():
+    for key in AREAS:
         _assert_csv_equal_as_text(expected_files[key], actual_files[key])
@@ -18,9 +18,12 @@ from idn_area_etl.writer import OutputWriter
 # ---------- Test config fixture ----------
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def config() -> Config:
-    """Provide a minimal configuration compatible with the production extractors."""
+    """
+    Provide a minimal configuration compatible with the production extractors.
+    Built once per session; tests must not mutate it.
+    """
 
     return Config(
         data={
@@ -42,6 +42,13 @@ class TestCleanName:
         assert clean_name("123\nSome Name\n456") == "Some Name"
         assert clean_name("1 Some Name") == "Some Name"
 
+    def test_row_numbers_are_ascii_digits_only(self):
+        # Non-ASCII digits are name text whether followed by a space or a line break
+        assert clean_name("\u0663 Name") == "\u0663 Name"
+        assert clean_name("\u0663\nName") == "\u0663 Name"
+        # ...while the space after an ASCII row number may still be a non-breaking one
+        assert clean_name("1\u00a0Name") == "Name"
+
 
 class TestFixWrappedName:
     """Test cases for the fix_wrapped_name function."""
@@ -190,29 +197,39 @@ class TestChunked:
     def test_chunk_size_one(self):
         assert list(chunked([1, 2, 3], 1)) == [[1], [2], [3]]
 
+    def test_accepts_any_iterable(self):
+        assert list(chunked(range(1, 6), 2)) == [[1, 2], [3, 4], [5]]
+        assert list(chunked((p for p in (7, 8, 9)), 2)) == [[7, 8], [9]]
+
 
 class TestValidateAndParsePageRange:
     """Test cases for page range helpers."""
 
-    def test_validate_page_range_positive(self):
-        assert validate_page_range("1,3,5-7,10")
-        assert validate_page_range("2-2")
+    @pytest.mark.parametrize("spec", ["1,3,5-7,10", "2-2"])
+    def test_validate_page_range_positive(self, spec: str):
+        assert validate_page_range(spec)
 
-    def test_validate_page_range_negative(self):
-        assert not validate_page_range("1,,3")
-        assert not validate_page_range("a-b")
-        assert not validate_page_range("")
+    @pytest.mark.parametrize("spec", ["1,,3", "a-b", ""])
+    def test_validate_page_range_negative(self, spec: str):
+        assert not validate_page_range(spec)
 
-    def test_parse_page_range_positive(self):
-        assert parse_page_range("1", 10) == [1]
-        assert parse_page_range("1,3,5", 10) == [1, 3, 5]
-        assert parse_page_range("1-3", 10) == [1, 2, 3]
-        assert parse_page_range("1-15", 10) == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-        assert parse_page_range("1-3,2,5-6,100", 10) == [1, 2, 3, 5, 6]
+    @pytest.mark.parametrize(
+        "spec, total_pages, expected",
+        [
+            ("1", 10, [1]),
+            ("1,3,5", 10, [1, 3, 5]),
+            ("1-3", 10, [1, 2, 3]),
+            ("1-15", 10, [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]),
+            ("1-3,2,5-6,100", 10, [1, 2, 3, 5, 6]),
+        ],
+    )
+    def test_parse_page_range_positive(self, spec: str, total_pages: int, expected: list[int]):
+        assert parse_page_range(spec, total_pages) == expected
 
-    def test_parse_page_range_negative_values_raise(self):
+    @pytest.mark.parametrize("spec", ["a-b", "1-2-3", " 1", "1 ,2", "+1"])
+    def test_parse_page_range_negative_values_raise(self, spec: str):
         with pytest.raises(ValueError):
-            parse_page_range("a-b", total_pages=10)
+            parse_page_range(spec, total_pages=10)
 
 
 class TestFormatDuration:
@@ -244,3 +261,7 @@ class TestConstants:
 
     def test_island_code_regex_negative(self):
         assert not RE_ISLAND_CODE.match("bad.code")
+
+    def test_island_code_regex_rejects_non_ascii_digits(self):
+        # Arabic-Indic digits are \d in Unicode mode but never valid in area codes
+        assert not RE_ISLAND_CODE.match("١١.٠١.٤٠٠٠١")
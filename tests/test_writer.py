@@ -1,3 +1,5 @@
+import csv
+import io
 from pathlib import Path
 
 import pytest
@@ -47,3 +49,22 @@ def test_flush_without_open_raises(tmp_path: Path) -> None:
     writer.add([["1"]])
     with pytest.raises(RuntimeError):
         writer.flush()
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [["11", "Aceh"], ["11.01", "11", "Simeulue"]],
+        [["1", "Koordinat 02°20'12.00\" N"], ["2", "a,b"]],
+        [["1", "Line\nbreak"], [""], ("3", 4)],
+    ],
+)
+def test_flush_matches_csv_writer_output(tmp_path: Path, rows: list[list[object]]) -> None:
+    expected = io.StringIO()
+    csv.writer(expected).writerows(rows)
+
+    target = tmp_path / "rows.csv"
+    with OutputWriter(target) as writer:
+        writer.add(rows)
+
+    assert target.read_bytes() == expected.getvalue().encode("utf-8")